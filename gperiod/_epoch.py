@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import datetime as dtm
+import typing as t
+
+
+EPOCH = dtm.datetime(1970, 1, 1)
+EPOCH_UTC = EPOCH.replace(tzinfo=dtm.timezone.utc)
+US = dtm.timedelta(microseconds=1)
+
+
+def to_key(value: dtm.datetime) -> int:
+    """Return microseconds since Unix epoch
+
+    Key is UTC-based for aware datetimes and wall-clock-based for naive ones,
+    both preserve ordering and equality within the same kind of datetimes.
+    """
+
+    if value.utcoffset() is None:
+        return (value - EPOCH) // US
+    return (value - EPOCH_UTC) // US
+
+
+def from_key(key: int,
+             tz: t.Optional[dtm.tzinfo] = None,
+             ) -> dtm.datetime:
+    """Return datetime from key (naive one if no timezone provided)"""
+
+    if tz is None:
+        return EPOCH + dtm.timedelta(microseconds=key)
+    value = EPOCH_UTC + dtm.timedelta(microseconds=key)
+    return value if tz is dtm.timezone.utc else value.astimezone(tz)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import enum
+import typing as t
+
+from gperiod import g
+
+
+class Relation(enum.IntEnum):
+    """Allen interval algebra relations of period `p` to period `q`
+
+    Every pair of periods is in exactly one of these relations.
+    Each relation has its inverse one: `relation(q, p)`.
+    """
+
+    BEFORE = 0          # p.end < q.start
+    MEETS = 1           # p.end == q.start
+    OVERLAPS = 2        # p.start < q.start < p.end < q.end
+    STARTS = 3          # p.start == q.start, p.end < q.end
+    DURING = 4          # q.start < p.start, p.end < q.end
+    FINISHES = 5        # q.start < p.start, p.end == q.end
+    EQUALS = 6          # p.start == q.start, p.end == q.end
+    FINISHED_BY = 7     # inverse of FINISHES
+    CONTAINS = 8        # inverse of DURING
+    STARTED_BY = 9      # inverse of STARTS
+    OVERLAPPED_BY = 10  # inverse of OVERLAPS
+    MET_BY = 11         # inverse of MEETS
+    AFTER = 12          # inverse of BEFORE
+
+    @property
+    def inverse(self) -> Relation:
+        return Relation(_LAST - self)
+
+
+_LAST = Relation.AFTER.value
+
+# (start vs start, end vs end) -> relation for intersecting periods,
+# with -1/0/1 standing for "<"/"=="/">"
+_OVERLAPPING = {
+    (-1, -1): Relation.OVERLAPS,
+    (-1, 0): Relation.FINISHED_BY,
+    (-1, 1): Relation.CONTAINS,
+    (0, -1): Relation.STARTS,
+    (0, 0): Relation.EQUALS,
+    (0, 1): Relation.STARTED_BY,
+    (1, -1): Relation.DURING,
+    (1, 0): Relation.FINISHES,
+    (1, 1): Relation.OVERLAPPED_BY,
+}
+
+
+def relation(period: g.PeriodProto, other: g.PeriodProto) -> Relation:
+    """Return Allen relation of period to other period
+
+    :param period: period-like object
+    :param other: period-like object
+    """
+
+    if period.end <= other.start:
+        if period.end == other.start:
+            return Relation.MEETS
+        return Relation.BEFORE
+    elif period.start >= other.end:
+        if period.start == other.end:
+            return Relation.MET_BY
+        return Relation.AFTER
+
+    s1, s2 = period.start, other.start
+    e1, e2 = period.end, other.end
+    return _OVERLAPPING[((s1 > s2) - (s1 < s2), (e1 > e2) - (e1 < e2))]
+
+
+def relations(periods: t.Iterable[g.PeriodProto],
+              others: t.Iterable[g.PeriodProto],
+              ) -> t.List[int]:
+    """Return Allen relation codes for pairs of periods
+
+    Codes are `Relation` values (plain integers, cheap to store and
+    compare in bulk). Collections must be of the same length.
+
+    :param periods: period-like objects
+    :param others: period-like objects
+    """
+
+    return [relation(p, q).value for p, q in _pairs(periods, others)]
+
+
+def relation_mask(periods: t.Iterable[g.PeriodProto],
+                  others: t.Iterable[g.PeriodProto],
+                  rel: Relation,
+                  ) -> t.List[bool]:
+    """Report for pairs of periods whether they are in the relation
+
+    Each pair is checked with the only comparisons the relation requires.
+    Collections must be of the same length.
+
+    :param periods: period-like objects
+    :param others: period-like objects
+    :param rel: relation to check
+    """
+
+    check = _CHECKS[Relation(rel)]
+    return [check(p.start, p.end, q.start, q.end)
+            for p, q in _pairs(periods, others)]
+
+
+def _pairs(periods: t.Iterable[g.PeriodProto],
+           others: t.Iterable[g.PeriodProto],
+           ) -> t.Iterator[t.Tuple[g.PeriodProto, g.PeriodProto]]:
+    if not isinstance(periods, t.Sized):
+        periods = list(periods)
+    if not isinstance(others, t.Sized):
+        others = list(others)
+    if len(periods) != len(others):
+        msg = (f"collections must be of the same length:"
+               f" {len(periods)} != {len(others)}")
+        raise ValueError(msg)
+    return zip(periods, others)
+
+
+_CHECKS: t.Dict[Relation, t.Callable[..., bool]] = {
+    Relation.BEFORE: lambda s1, e1, s2, e2: e1 < s2,
+    Relation.MEETS: lambda s1, e1, s2, e2: e1 == s2,
+    Relation.OVERLAPS: lambda s1, e1, s2, e2: s1 < s2 < e1 < e2,
+    Relation.STARTS: lambda s1, e1, s2, e2: s1 == s2 and e1 < e2,
+    Relation.DURING: lambda s1, e1, s2, e2: s2 < s1 and e1 < e2,
+    Relation.FINISHES: lambda s1, e1, s2, e2: s2 < s1 and e1 == e2,
+    Relation.EQUALS: lambda s1, e1, s2, e2: s1 == s2 and e1 == e2,
+    Relation.FINISHED_BY: lambda s1, e1, s2, e2: s1 < s2 and e1 == e2,
+    Relation.CONTAINS: lambda s1, e1, s2, e2: s1 < s2 and e2 < e1,
+    Relation.STARTED_BY: lambda s1, e1, s2, e2: s1 == s2 and e2 < e1,
+    Relation.OVERLAPPED_BY: lambda s1, e1, s2, e2: s2 < s1 < e2 < e1,
+    Relation.MET_BY: lambda s1, e1, s2, e2: s1 == e2,
+    Relation.AFTER: lambda s1, e1, s2, e2: e2 < s1,
+}
@@ -1,4 +1,9 @@
+from __future__ import annotations
+
+import bisect
+import collections
 import datetime as dtm
+import heapq
 import operator
 import typing as t
 
@@ -7,6 +12,10 @@ from gperiod import g
 
 _SORT_KEY_END = operator.attrgetter(g._F_END)
 
+ADDED = "added"
+REMOVED = "removed"
+UNCHANGED = "unchanged"
+
 
 # sorting
 
@@ -25,6 +34,45 @@ def descend_end(*periods: g.PeriodProto, reverse: bool = False,
 
 # misc
 
+def unique(periods: t.Iterable[g.PeriodProto],
+           ) -> t.Generator[g.PeriodProto, None, None]:
+    """Yield periods skipping repeated edges
+
+    First occurrence wins, order is preserved. Periods are keyed by a tuple
+    of edges, so any period-like objects can be mixed.
+
+    :param periods: period-like objects
+    """
+
+    seen: t.Set[g._T_DT_PAIR] = set()
+    add = seen.add
+    for period in periods:
+        key = (period.start, period.end)
+        if key not in seen:
+            add(key)
+            yield period
+
+
+def group_identical(periods: t.Iterable[g.PeriodProto],
+                    ) -> t.Dict[g._T_DT_PAIR, t.List[g.PeriodProto]]:
+    """Group periods by edges in one pass
+
+    Return a mapping of edge tuples to periods having these edges,
+    in order of first appearance.
+
+    :param periods: period-like objects
+    """
+
+    groups: t.Dict[g._T_DT_PAIR, t.List[g.PeriodProto]] = {}
+    for period in periods:
+        key = (period.start, period.end)
+        try:
+            groups[key].append(period)
+        except KeyError:
+            groups[key] = [period]
+    return groups
+
+
 def to_timestamps(*periods: g.PeriodProto,
                   ) -> t.Generator[dtm.datetime, None, None]:
     """Flatten periods into sequence of edges
@@ -35,3 +83,336 @@ def to_timestamps(*periods: g.PeriodProto,
     for period in periods:
         yield period.start
         yield period.end
+
+
+# lookup
+
+def locate(timestamps: t.Iterable[dtm.datetime],
+           periods: t.Sequence[g.PeriodProto],
+           as_period: bool = False,
+           presorted: bool = False,
+           ) -> t.Generator[t.Any, None, None]:
+    """Classify timestamps by disjoint periods
+
+    For every timestamp yield the index of the period containing it
+    (or the period itself with `as_period`), `None` for timestamps outside
+    of all periods. Edges are inclusive (see `g.contains`), a timestamp on
+    the edge of two touching periods is attributed to the later one.
+
+    Periods must be disjoint and sorted by start, this is not validated.
+    Each timestamp costs one bisection over period starts. For ascending
+    timestamps pass `presorted` to narrow every bisection down to the tail
+    following previous match.
+
+    :param timestamps: timestamps to classify
+    :param periods: disjoint period-like objects sorted by start
+    :param as_period: yield periods instead of indices
+    :param presorted: timestamps are sorted ascending
+    """
+
+    starts = [p.start for p in periods]
+    ends = [p.end for p in periods]
+    right = bisect.bisect_right
+    lo = 0
+    for ts in timestamps:
+        i = right(starts, ts, lo) - 1
+        if presorted and i > 0:
+            lo = i
+        if i < 0 or ts > ends[i]:
+            yield None
+        elif as_period:
+            yield periods[i]
+        else:
+            yield i
+
+
+# bulk math operations
+
+def lshift_many(periods: t.Iterable[g.PeriodProto],
+                delta: dtm.timedelta,
+                factory: g._T_FACTORY = g.Period,
+                ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+    """Shift every period left by timedelta (see `g.lshift`)
+
+    Shifting preserves edge order, so resulting edges are not validated.
+
+    :param periods: period-like objects
+    :param delta: shift value
+    :param factory: resulting type factory to convert edges to the end result
+    """
+
+    if not isinstance(delta, dtm.timedelta):
+        raise NotImplementedError()
+
+    return _shift_many(periods, -delta, factory)
+
+
+def rshift_many(periods: t.Iterable[g.PeriodProto],
+                delta: dtm.timedelta,
+                factory: g._T_FACTORY = g.Period,
+                ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+    """Shift every period right by timedelta (see `g.rshift`)
+
+    Shifting preserves edge order, so resulting edges are not validated.
+
+    :param periods: period-like objects
+    :param delta: shift value
+    :param factory: resulting type factory to convert edges to the end result
+    """
+
+    if not isinstance(delta, dtm.timedelta):
+        raise NotImplementedError()
+
+    return _shift_many(periods, delta, factory)
+
+
+def _shift_many(periods: t.Iterable[g.PeriodProto],
+                delta: dtm.timedelta,
+                factory: g._T_FACTORY,
+                ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+    factory = g._trusted(factory)
+    for period in periods:
+        yield factory(period.start + delta, period.end + delta)
+
+
+def mul_many(periods: t.Iterable[g.PeriodProto],
+             factor: int | float,
+             factory: g._T_FACTORY = g.Period,
+             ) -> t.Generator[g._T_FACTORY_RESULT_OPT, None, None]:
+    """Scale every period by number (see `g.mul`)
+
+    Scaling by a non-zero integer preserves edge order, so resulting edges
+    are not validated. Fractional factors may round durations down to zero
+    and are validated as usual.
+
+    :param periods: period-like objects
+    :param factor: scale value
+    :param factory: resulting type factory to convert edges to the end result
+    """
+
+    if factor == 0:
+        return (None for _ in periods)
+    if isinstance(factor, int):
+        factory = g._trusted(factory)
+    return (g.mul(period, factor, factory=factory) for period in periods)
+
+
+def floordiv_many(periods: t.Iterable[g.PeriodProto],
+                  other: dtm.timedelta | int,
+                  ) -> t.Generator[dtm.timedelta | int, None, None]:
+    """Floor-divide duration of every period (see `g.floordiv`)
+
+    :param periods: period-like objects
+    :param other: divisor
+    """
+
+    if not isinstance(other, (dtm.timedelta, int)):
+        raise NotImplementedError()
+
+    return ((p.end - p.start) // other for p in periods)
+
+
+def mod_many(periods: t.Iterable[g.PeriodProto],
+             other: dtm.timedelta,
+             ) -> t.Generator[dtm.timedelta, None, None]:
+    """Remainder of duration of every period (see `g.mod`)
+
+    :param periods: period-like objects
+    :param other: divisor
+    """
+
+    if not isinstance(other, dtm.timedelta):
+        raise NotImplementedError()
+
+    return ((p.end - p.start) % other for p in periods)
+
+
+def truediv_many(periods: t.Iterable[g.PeriodProto],
+                 other: dtm.timedelta | int | float,
+                 ) -> t.Generator[dtm.timedelta | float, None, None]:
+    """Divide duration of every period (see `g.truediv`)
+
+    :param periods: period-like objects
+    :param other: divisor
+    """
+
+    if not isinstance(other, (dtm.timedelta, int, float)):
+        raise NotImplementedError()
+
+    return ((p.end - p.start) / other for p in periods)
+
+
+# set operations over collections
+
+def _coalesce(periods: t.Iterable[g.PeriodProto],
+              ) -> t.Generator[g._T_DT_PAIR, None, None]:
+    """Merge overlapping and touching periods sorted by start
+
+    Raise ValueError on unsorted input.
+    """
+
+    it = iter(periods)
+    for first in it:
+        start, end = first.start, first.end
+        break
+    else:
+        return
+
+    for period in it:
+        if period.start < start:
+            msg = (f"periods must be sorted by '{g._F_START}':"
+                   f" '{period.start}' < '{start}'")
+            raise ValueError(msg)
+        elif period.start > end:
+            yield start, end
+            start, end = period.start, period.end
+        elif period.end > end:
+            end = period.end
+    yield start, end
+
+
+def _edge_events(periods: t.Iterable[g.PeriodProto], bit: int,
+                 ) -> t.Generator[t.Tuple[dtm.datetime, int], None, None]:
+    for start, end in _coalesce(periods):
+        yield start, bit
+        yield end, -bit
+
+
+def changes(old: t.Iterable[g.PeriodProto],
+            new: t.Iterable[g.PeriodProto],
+            factory: g._T_FACTORY = g.Period,
+            ) -> t.Generator[t.Tuple[str, g._T_FACTORY_RESULT], None, None]:
+    f"""Yield changeset between two timelines
+
+    Both inputs are coalesced (overlapping and touching periods merged) and
+    compared in one merge pass. Yield pairs of a change tag and a span in
+    ascending order: '{ADDED}' (covered by `new` only), '{REMOVED}' (covered
+    by `old` only) and '{UNCHANGED}' (covered by both). Consecutive spans
+    always differ by tag.
+
+    Inputs must be sorted by '{g._F_START}', ValueError is raised otherwise.
+
+    :param old: period-like objects sorted by start
+    :param new: period-like objects sorted by start
+    :param factory: resulting type factory to convert edges to spans
+    """
+
+    tags = {1: REMOVED, 2: ADDED, 3: UNCHANGED}
+    factory = g._trusted(factory)
+    events = heapq.merge(_edge_events(old, 1), _edge_events(new, 2),
+                         key=operator.itemgetter(0))
+    state = 0
+    prev = None
+    for ts, bit in events:
+        if state and ts != prev:
+            yield tags[state], factory(prev, ts)
+        state += bit
+        prev = ts
+
+
+def difference_many(bases: t.Iterable[g.PeriodProto],
+                    exclusions: t.Iterable[g.PeriodProto],
+                    factory: g._T_FACTORY = g.Period,
+                    ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+    """Subtract exclusions from every base period
+
+    Sort both sides once and run `difference_sorted`, so the whole job costs
+    O((N+M) log(N+M)) instead of `g.difference` per base.
+
+    :param bases: period-like objects to subtract from
+    :param exclusions: period-like objects to subtract
+    :param factory: resulting type factory to convert edges to fragments
+    """
+
+    return difference_sorted(sorted(bases, key=g._SORT_KEY_START),
+                             sorted(exclusions, key=g._SORT_KEY_START),
+                             factory=factory)
+
+
+def difference_sorted(bases: t.Iterable[g.PeriodProto],
+                      exclusions: t.Iterable[g.PeriodProto],
+                      factory: g._T_FACTORY = g.Period,
+                      ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+    f"""Subtract exclusions from every base period in one sweep
+
+    Streaming variant of `difference_many` for inputs sorted by
+    '{g._F_START}' (ValueError is raised otherwise). Exclusions are
+    coalesced on the fly and only ones reaching the current base are kept
+    in memory. Remaining fragments are yielded base by base.
+
+    :param bases: period-like objects sorted by start
+    :param exclusions: period-like objects sorted by start
+    :param factory: resulting type factory to convert edges to fragments
+    """
+
+    factory = g._trusted(factory)
+    blocks = _coalesce(exclusions)
+    pending: t.Deque[g._T_DT_PAIR] = collections.deque()
+    exhausted = False
+    last = None
+    for base in bases:
+        start, end = base.start, base.end
+        if last is not None and start < last:
+            msg = (f"periods must be sorted by '{g._F_START}':"
+                   f" '{start}' < '{last}'")
+            raise ValueError(msg)
+        last = start
+
+        while pending and pending[0][1] <= start:
+            pending.popleft()
+        while not exhausted and (not pending or pending[-1][0] < end):
+            block = next(blocks, None)
+            if block is None:
+                exhausted = True
+            elif block[1] > start:
+                pending.append(block)
+
+        cursor = start
+        for x_start, x_end in pending:
+            if x_start >= end:
+                break
+            elif x_start > cursor:
+                yield factory(cursor, x_start)
+            cursor = max(cursor, x_end)
+        if cursor < end:
+            yield factory(cursor, end)
+
+
+def find_overlaps(periods: t.Iterable[g.PeriodProto],
+                  ) -> t.Generator[t.Tuple[g.PeriodProto, g.PeriodProto],
+                                   None, None]:
+    """Yield all pairs of overlapping periods
+
+    Sweep-line over periods sorted by start with a heap of active periods,
+    so cost is O(n log n + k) for k pairs found. Same semantics as
+    `g.intersection`: touching periods do not overlap. In every pair the
+    first period starts no later than the second one.
+
+    :param periods: period-like objects
+    """
+
+    active: t.List[t.Tuple[dtm.datetime, int, g.PeriodProto]] = []
+    ordered = sorted(periods, key=g._SORT_KEY_START)
+    for i, period in enumerate(ordered):
+        while active and active[0][0] <= period.start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, period
+        heapq.heappush(active, (period.end, i, period))
+
+
+def has_overlaps(periods: t.Iterable[g.PeriodProto]) -> bool:
+    """Report whether any two periods overlap
+
+    Stops at the first overlap found after sorting periods by start.
+
+    :param periods: period-like objects
+    """
+
+    max_end = None
+    for period in sorted(periods, key=g._SORT_KEY_START):
+        if max_end is not None and period.start < max_end:
+            return True
+        if max_end is None or period.end > max_end:
+            max_end = period.end
+    return False
@@ -10,6 +10,7 @@ import typing as t
 _F_START = "start"
 _F_END = "end"
 _F__DURATION = "_duration"
+_F__HASH = "_hash"
 
 _SEP = "/"
 _DT_SEP = "T"
@@ -57,7 +58,7 @@ class Period:
     start: dtm.datetime
     end: dtm.datetime
 
-    __slots__ = (_F_START, _F_END, _F__DURATION)
+    __slots__ = (_F_START, _F_END, _F__DURATION, _F__HASH)
 
     def __init__(self, start: dtm.datetime, end: dtm.datetime):
         validate_edges(start, end)
@@ -108,11 +109,21 @@ class Period:
     def __delattr__(self, item: str) -> None:
         raise NotImplementedError("method not allowed")
 
+    def __set_hash(self) -> int:
+        value = hash((self.start, self.end))
+        object.__setattr__(self, _F__HASH, value)
+        return value
+
     def __hash__(self) -> int:
-        return hash((self.start, self.end))
+        try:
+            return getattr(self, _F__HASH)
+        except AttributeError:
+            return self.__set_hash()
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Period):
+        if self is other:
+            return True
+        elif isinstance(other, Period):
             return self.start == other.start and self.end == other.end
         elif hasattr(other, _F_START) and hasattr(other, _F_END):
             return False
@@ -240,6 +251,15 @@ class Period:
 #  - ensure pickling
 
 
+def _trusted(factory: _T_FACTORY) -> _T_FACTORY:
+    """Return factory variant skipping edge validation (when available)
+
+    For producers of edges which are valid by construction.
+    """
+
+    return getattr(factory, "load_edges", factory)
+
+
 # sorting
 
 def ascend_start(*periods: PeriodProto,
@@ -592,11 +612,63 @@ def rshift(period: PeriodProto,
 
 # TODO(d.burmistrov): jumping search + check ISO spec for sep alphabets
 def fromisoformat(s: str, sep: str = _SEP, factory: _T_FACTORY = Period):
+    if _parse_cache is not None:
+        return _parse_cache(s, sep, factory)
+    return _fromisoformat(s, sep, factory)
+
+
+def _fromisoformat(s: str, sep: str, factory: _T_FACTORY):
     conv = dtm.datetime.fromisoformat
     start, _, end = s.partition(sep)
     return factory(conv(start), conv(end))
 
 
+_parse_cache: t.Optional[t.Callable[[str, str, _T_FACTORY], t.Any]] = None
+
+
+class ParseCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def enable_parse_cache(maxsize: int = 4096) -> None:
+    """Enable bounded LRU cache for `fromisoformat`
+
+    Parsed results are memoized by (string, separator, factory) and shared
+    between callers (and threads), so it is safe for immutable results only
+    (like `Period` and `Tuple` factories). Enabling replaces (and so clears)
+    the cache if it is already enabled.
+
+    :param maxsize: maximum number of cached results
+    """
+
+    global _parse_cache
+    _parse_cache = functools.lru_cache(maxsize=maxsize)(_fromisoformat)
+
+
+def disable_parse_cache() -> None:
+    """Disable and drop `fromisoformat` cache"""
+
+    global _parse_cache
+    _parse_cache = None
+
+
+def parse_cache_info() -> t.Optional[ParseCacheInfo]:
+    """Return `fromisoformat` cache statistics (`None` if disabled)"""
+
+    cache = _parse_cache
+    if cache is None:
+        return None
+    return ParseCacheInfo(*cache.cache_info())  # type: ignore[attr-defined]
+
+
 # TODO(d.burmistrov): check ISO spec for sep alphabets
 def isoformat(obj: PeriodProto,
               dt_sep=_DT_SEP,
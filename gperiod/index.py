@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import bisect
+import datetime as dtm
+import typing as t
+
+from gperiod import g
+
+
+class CountIndex:
+    """Count-only index over a static collection of periods
+
+    Keeps two independently sorted lists of period edges, so that each query
+    is answered with two bisections instead of a scan over every period.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, *periods: g.PeriodProto):
+        self._starts = sorted(p.start for p in periods)
+        self._ends = sorted(p.end for p in periods)
+
+    @classmethod
+    def from_edges(cls,
+                   starts: t.Iterable[dtm.datetime],
+                   ends: t.Iterable[dtm.datetime],
+                   ) -> CountIndex:
+        """Make a CountIndex from edge sequences
+
+        Edges are sorted on load, pairing between starts and ends is
+        irrelevant for counting.
+
+        :param starts: period starts
+        :param ends: period ends
+        """
+
+        inst = cls.__new__(cls)
+        inst._starts = sorted(starts)
+        inst._ends = sorted(ends)
+        if len(inst._starts) != len(inst._ends):
+            msg = (f"edge count mismatch: {len(inst._starts)} starts"
+                   f" and {len(inst._ends)} ends")
+            raise ValueError(msg)
+        return inst
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} periods>)"
+
+    def count_overlaps(self, period: g.PeriodProto) -> int:
+        """Count periods having non-empty intersection with period
+
+        Same semantics as `g.intersection`: touching periods do not overlap.
+
+        :param period: period-like object
+        """
+
+        # periods starting at/after `period.end` and periods ending
+        # at/before `period.start` are disjoint sets -- subtract both
+        return (bisect.bisect_left(self._starts, period.end)
+                - bisect.bisect_right(self._ends, period.start))
+
+    def count_contains(self, item: dtm.datetime) -> int:
+        """Count periods containing timestamp
+
+        Same semantics as `g.contains`: edges are inclusive.
+
+        :param item: timestamp
+        """
+
+        return (bisect.bisect_right(self._starts, item)
+                - bisect.bisect_left(self._ends, item))
+
+    def count_overlaps_many(self, periods: t.Iterable[g.PeriodProto],
+                            ) -> t.List[int]:
+        """Batched `count_overlaps`
+
+        :param periods: period-like objects
+        """
+
+        left = bisect.bisect_left
+        right = bisect.bisect_right
+        starts = self._starts
+        ends = self._ends
+        return [left(starts, p.end) - right(ends, p.start) for p in periods]
+
+    def count_contains_many(self, items: t.Iterable[dtm.datetime],
+                            ) -> t.List[int]:
+        """Batched `count_contains`
+
+        :param items: timestamps
+        """
+
+        left = bisect.bisect_left
+        right = bisect.bisect_right
+        starts = self._starts
+        ends = self._ends
+        return [right(starts, ts) - left(ends, ts) for ts in items]
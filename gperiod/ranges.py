@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import datetime as dtm
+import typing as t
+
+from gperiod import g
+
+
+def _clip_range(r: range, lo: int, hi: int) -> range:
+    """Return sub-range of values within [lo, hi)"""
+
+    if r.step < 0:
+        return _clip_range(r[::-1], lo, hi)[::-1]
+
+    i = max(0, -((r.start - lo) // r.step))  # ceil
+    j = max(i, -((r.start - hi) // r.step))  # ceil
+    return r[i:j]
+
+
+class PeriodRange:
+    """Lazy immutable sequence of regular back-to-back periods
+
+    Analogous to `range`: member `i` is the period starting at
+    `start + i * step` and lasting `step`. Exactly one of `count` and `end`
+    has to be provided, with `end` the range holds all periods ending
+    before or at `end`.
+
+    Length, indexing, slicing, membership and lookups are arithmetic
+    and do not enumerate members. Slicing keeps the range lazy, so the
+    sliced members are not necessarily back-to-back anymore.
+
+    :param start: start of the first period
+    :param step: duration of every period
+    :param count: number of periods
+    :param end: upper bound for the end of the last period
+    :param factory: resulting type factory to convert edges to members
+    """
+
+    __slots__ = ("_origin", "_step", "_range", "_factory")
+
+    def __init__(self,
+                 start: dtm.datetime,
+                 step: dtm.timedelta,
+                 count: t.Optional[int] = None,
+                 end: t.Optional[dtm.datetime] = None,
+                 factory: g._T_FACTORY = g.Period,
+                 ):
+        if not isinstance(step, dtm.timedelta):
+            raise TypeError(f"'step' must be timedelta: '{type(step)}'")
+        g.validate_edges(start, start + step)
+
+        if (count is None) == (end is None):
+            raise TypeError("exactly one of 'count' and 'end' is required")
+        elif end is not None:
+            count = max(0, (end - start) // step)
+        elif count < 0:  # type: ignore[operator]
+            raise ValueError(f"'count' must be non-negative: '{count}'")
+
+        self._origin = start
+        self._step = step
+        self._range = range(t.cast(int, count))
+        self._factory = g._trusted(factory)
+
+    @classmethod
+    def _load(cls,
+              origin: dtm.datetime,
+              step: dtm.timedelta,
+              r: range,
+              factory: g._T_FACTORY,
+              ) -> PeriodRange:
+        inst = cls.__new__(cls)
+        inst._origin = origin
+        inst._step = step
+        inst._range = r
+        inst._factory = factory
+        return inst
+
+    def _derive(self, r: range) -> PeriodRange:
+        return self._load(self._origin, self._step, r, self._factory)
+
+    def _member(self, k: int) -> g._T_FACTORY_RESULT:
+        start = self._origin + self._step * k
+        return self._factory(start, start + self._step)
+
+    @property
+    def step(self) -> dtm.timedelta:
+        return self._step
+
+    @property
+    def span(self) -> t.Optional[g._T_FACTORY_RESULT]:
+        """Period covering all members or `None` for an empty range"""
+
+        if not self._range:
+            return None
+        lo = min(self._range[0], self._range[-1])
+        hi = max(self._range[0], self._range[-1]) + 1
+        return self._factory(self._origin + self._step * lo,
+                             self._origin + self._step * hi)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __bool__(self) -> bool:
+        return bool(self._range)
+
+    def __iter__(self) -> t.Iterator[g._T_FACTORY_RESULT]:
+        return map(self._member, self._range)
+
+    def __reversed__(self) -> t.Iterator[g._T_FACTORY_RESULT]:
+        return map(self._member, reversed(self._range))
+
+    @t.overload
+    def __getitem__(self, item: int) -> g._T_FACTORY_RESULT:
+        ...
+
+    @t.overload
+    def __getitem__(self, item: slice) -> PeriodRange:
+        ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._derive(self._range[item])
+        return self._member(self._range[item])
+
+    def _position(self, item: t.Any) -> t.Optional[int]:
+        try:
+            start, end = item.start, item.end
+            if end - start != self._step:
+                return None
+            k, rem = divmod(start - self._origin, self._step)
+        except (AttributeError, TypeError):
+            return None
+        if rem or k not in self._range:
+            return None
+        return k
+
+    def __contains__(self, item: t.Any) -> bool:
+        return self._position(item) is not None
+
+    def index(self, item: g.PeriodProto) -> int:
+        """Return index of the member equal to period
+
+        Raise ValueError if there is no such member.
+        """
+
+        k = self._position(item)
+        if k is None:
+            raise ValueError(f"{item!r} is not in range")
+        return self._range.index(k)
+
+    def count(self, item: g.PeriodProto) -> int:
+        """Return number of members equal to period"""
+
+        return int(item in self)
+
+    def intersection(self, period: g.PeriodProto) -> PeriodRange:
+        """Return sub-range of members overlapping period
+
+        Same semantics as `g.intersection`: touching periods do not overlap.
+
+        :param period: period-like object
+        """
+
+        lo = (period.start - self._origin) // self._step
+        hi = -((self._origin - period.end) // self._step)
+        return self._derive(_clip_range(self._range, lo, hi))
+
+    __and__ = intersection
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PeriodRange):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        r = self._range
+        if not r:
+            return ()
+        first = self._origin + self._step * r[0]
+        stride = self._step * r.step if len(r) > 1 else None
+        return first, self._step, stride, len(r)
+
+    def __repr__(self) -> str:
+        r = self._range
+        if r.start == 0 and r.step == 1:
+            return (f"{self.__class__.__name__}({self._origin!r},"
+                    f" {self._step!r}, count={len(r)})")
+        return (f"{self.__class__.__name__}({self._origin!r},"
+                f" {self._step!r})[{r.start}:{r.stop}:{r.step}]")
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import array
+import bisect
+import datetime as dtm
+import struct
+import sys
+import typing as t
+from multiprocessing import shared_memory
+
+from gperiod import _epoch
+from gperiod import g
+
+
+# header: period count, aware flag
+_HEADER = struct.Struct("<qq")
+_ITEM = 8  # int64
+# starts (sorted), ends (in starts order), running max of ends, ends (sorted)
+_ARRAYS = 4
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # NOTE(d.burmistrov): before 3.13 attaching process registers memory at
+    #   resource tracker too -- harmless for workers spawned by the owner
+    #   (they share its tracker), but an unrelated process unlinks memory
+    #   on its exit
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedPeriods:
+    """Static period collection published to shared memory
+
+    Edges are stored as int64 microsecond epoch keys (see `_epoch`) together
+    with sort/index metadata, so any process can attach to the collection
+    by name and run queries without unpickling or copying periods.
+    Attached views are read-only.
+
+    Lifecycle: the publishing process owns the memory block and has to
+    `unlink` it once workers are done, every process (owner included) has to
+    `close` its own view. Used as a context manager the object closes on
+    exit and unlinks too if it is the owner.
+
+    Aware periods are published in UTC and returned as UTC-aware periods.
+    """
+
+    __slots__ = ("_shm", "_owner", "_tz", "_views",
+                 "_starts", "_ends", "_max_ends", "_sorted_ends")
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        count, aware = _HEADER.unpack_from(shm.buf)
+        self._tz = dtm.timezone.utc if aware else None
+        data = shm.buf[_HEADER.size:_HEADER.size + count * _ITEM * _ARRAYS]
+        data = data.toreadonly().cast("q")
+        self._views = [data] + [data[i * count:(i + 1) * count]
+                                for i in range(_ARRAYS)]
+        (self._starts, self._ends,
+         self._max_ends, self._sorted_ends) = self._views[1:]
+
+    @classmethod
+    def publish(cls,
+                periods: t.Iterable[g.PeriodProto],
+                name: t.Optional[str] = None,
+                ) -> SharedPeriods:
+        """Publish periods to a new shared memory block
+
+        :param periods: period-like objects (all naive or all aware)
+        :param name: shared memory block name (random by default)
+        """
+
+        to_key = _epoch.to_key
+        aware: t.Set[bool] = set()
+        edges = []
+        for period in periods:
+            aware.add(period.start.utcoffset() is not None)
+            edges.append((to_key(period.start), to_key(period.end)))
+        if len(aware) > 1:
+            raise ValueError("Can't mix naive and aware periods")
+        edges.sort()
+
+        starts = array.array("q", (s for s, _ in edges))
+        ends = array.array("q", (e for _, e in edges))
+        max_ends = array.array("q", ends)
+        for i in range(1, len(max_ends)):
+            if max_ends[i] < max_ends[i - 1]:
+                max_ends[i] = max_ends[i - 1]
+        sorted_ends = array.array("q", sorted(ends))
+
+        count = len(edges)
+        size = _HEADER.size + count * _ITEM * _ARRAYS
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        try:
+            _HEADER.pack_into(shm.buf, 0, count, int(aware == {True}))
+            offset = _HEADER.size
+            for data in (starts, ends, max_ends, sorted_ends):
+                raw = data.tobytes()
+                shm.buf[offset:offset + len(raw)] = raw
+                offset += len(raw)
+            return cls(shm, owner=True)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> SharedPeriods:
+        """Attach to periods published by another process
+
+        :param name: shared memory block name
+        """
+
+        return cls(_attach(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        """Release this process view of shared memory"""
+
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy shared memory block (owner only)"""
+
+        if not self._owner:
+            raise RuntimeError("only owner can unlink shared periods")
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedPeriods:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, <{len(self)} periods>)"
+
+    def _key(self, value: dtm.datetime) -> int:
+        if (value.utcoffset() is None) != (self._tz is None):
+            raise ValueError("Can't mix naive and aware edges")
+        return _epoch.to_key(value)
+
+    def _load(self, i: int, factory: g._T_FACTORY) -> g._T_FACTORY_RESULT:
+        return factory(_epoch.from_key(self._starts[i], self._tz),
+                       _epoch.from_key(self._ends[i], self._tz))
+
+    def __getitem__(self, item: int) -> g.Period:
+        """Return period by position in ascending start order"""
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("shared periods index out of range")
+        return self._load(item, g.Period.load_edges)
+
+    def count_contains(self, item: dtm.datetime) -> int:
+        """Count periods containing timestamp (see `g.contains`)
+
+        :param item: timestamp
+        """
+
+        key = self._key(item)
+        return (bisect.bisect_right(self._starts, key)
+                - bisect.bisect_left(self._sorted_ends, key))
+
+    def count_overlaps(self, period: g.PeriodProto) -> int:
+        """Count periods overlapping period (see `g.intersection`)
+
+        :param period: period-like object
+        """
+
+        return (bisect.bisect_left(self._starts, self._key(period.end))
+                - bisect.bisect_right(self._sorted_ends,
+                                      self._key(period.start)))
+
+    def _scan(self, hi: int, after: int) -> t.List[int]:
+        # ascending positions before `hi` with end >= `after`, walking back
+        # while running max of ends says there are candidates left
+        ends = self._ends
+        max_ends = self._max_ends
+        found = []
+        for i in range(hi - 1, -1, -1):
+            if max_ends[i] < after:
+                break
+            if ends[i] >= after:
+                found.append(i)
+        found.reverse()
+        return found
+
+    def containing(self,
+                   item: dtm.datetime,
+                   factory: g._T_FACTORY = g.Period,
+                   ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+        """Yield periods containing timestamp (see `g.contains`)
+
+        Periods are yielded in ascending start order.
+
+        :param item: timestamp
+        :param factory: resulting type factory to convert edges to periods
+        """
+
+        key = self._key(item)
+        hi = bisect.bisect_right(self._starts, key)
+        factory = g._trusted(factory)
+        for i in self._scan(hi, key):
+            yield self._load(i, factory)
+
+    def overlapping(self,
+                    period: g.PeriodProto,
+                    factory: g._T_FACTORY = g.Period,
+                    ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+        """Yield periods overlapping period (see `g.intersection`)
+
+        Periods are yielded in ascending start order.
+
+        :param period: period-like object
+        :param factory: resulting type factory to convert edges to periods
+        """
+
+        hi = bisect.bisect_left(self._starts, self._key(period.end))
+        after = self._key(period.start) + 1  # touching is not overlapping
+        factory = g._trusted(factory)
+        for i in self._scan(hi, after):
+            yield self._load(i, factory)
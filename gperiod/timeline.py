@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import bisect
+import collections
+import contextlib
+import datetime as dtm
+import typing as t
+
+from gperiod import g
+
+
+class Timeline:
+    """Mutable collection of periods with a live merged view
+
+    Periods (reservations) can overlap and repeat. Next to them the timeline
+    keeps merged disjoint blocks of busy time: overlapping and touching
+    periods are combined in the same way as `g.union` does.
+
+    Both the edge map and the merged blocks are plain sorted lists updated
+    with bisection, so each change locates its place in O(log n) and only
+    touches the affected block instead of re-running `g.union` or
+    `g.difference` over everything.
+    """
+
+    __slots__ = ("_periods", "_edges", "_delta", "_starts", "_ends")
+
+    def __init__(self, *periods: g.PeriodProto):
+        self._periods: t.Counter[g._T_DT_PAIR] = collections.Counter()
+        self._edges: t.List[dtm.datetime] = []
+        self._delta: t.Dict[dtm.datetime, int] = {}
+        self._starts: t.List[dtm.datetime] = []
+        self._ends: t.List[dtm.datetime] = []
+        for period in periods:
+            self.insert(period)
+
+    def __len__(self) -> int:
+        return sum(self._periods.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._periods)
+
+    def __contains__(self, item: g.PeriodProto) -> bool:
+        return (item.start, item.end) in self._periods
+
+    def __iter__(self) -> t.Iterator[g.Period]:
+        for (start, end), count in sorted(self._periods.items()):
+            for _ in range(count):
+                yield g.Period.load_edges(start, end)
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(<{len(self)} periods,"
+                f" {len(self._starts)} blocks>)")
+
+    def _shift_edge(self, edge: dtm.datetime, delta: int) -> None:
+        value = self._delta.get(edge, 0) + delta
+        if value:
+            if edge not in self._delta:
+                bisect.insort(self._edges, edge)
+            self._delta[edge] = value
+        else:
+            del self._delta[edge]
+            del self._edges[bisect.bisect_left(self._edges, edge)]
+
+    def insert(self, period: g.PeriodProto) -> None:
+        """Add period to the timeline
+
+        :param period: period-like object
+        """
+
+        start, end = period.start, period.end
+        g.validate_edges(start, end)
+        self._periods[(start, end)] += 1
+        self._shift_edge(start, 1)
+        self._shift_edge(end, -1)
+
+        # blocks overlapping or touching the period collapse into one
+        i = bisect.bisect_left(self._ends, start)
+        j = bisect.bisect_right(self._starts, end)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def remove(self, period: g.PeriodProto) -> None:
+        """Remove period from the timeline
+
+        Raise KeyError if there is no such period.
+
+        :param period: period-like object
+        """
+
+        key = (period.start, period.end)
+        if key not in self._periods:
+            raise KeyError(period)
+
+        self._periods[key] -= 1
+        if not self._periods[key]:
+            del self._periods[key]
+        self._shift_edge(key[0], -1)
+        self._shift_edge(key[1], 1)
+
+        # re-scan edges of the only block affected
+        i = bisect.bisect_right(self._starts, key[0]) - 1
+        block_end = self._ends[i]
+        starts = []
+        ends = []
+        running = 0
+        edges = self._edges
+        k = bisect.bisect_left(edges, self._starts[i])
+        while k < len(edges) and edges[k] <= block_end:
+            edge = edges[k]
+            k += 1
+            if not running:
+                starts.append(edge)
+            running += self._delta[edge]
+            if not running:
+                ends.append(edge)
+        self._starts[i:i + 1] = starts
+        self._ends[i:i + 1] = ends
+
+    def discard(self, period: g.PeriodProto) -> None:
+        """Remove period from the timeline if present
+
+        :param period: period-like object
+        """
+
+        with contextlib.suppress(KeyError):
+            self.remove(period)
+
+    def merged(self, factory: g._T_FACTORY = g.Period,
+               ) -> t.Generator[g._T_FACTORY_RESULT, None, None]:
+        """Yield merged disjoint busy blocks in ascending order
+
+        :param factory: resulting type factory to convert edges to blocks
+        """
+
+        factory = g._trusted(factory)
+        for start, end in zip(self._starts, self._ends):
+            yield factory(start, end)
+
+    def is_busy(self, item: dtm.datetime) -> bool:
+        """Report whether timestamp is covered by any period
+
+        :param item: timestamp
+        """
+
+        i = bisect.bisect_right(self._starts, item) - 1
+        return i >= 0 and item <= self._ends[i]
+
+    def first_free(self,
+                   duration: dtm.timedelta,
+                   after: dtm.datetime,
+                   factory: g._T_FACTORY = g.Period,
+                   ) -> g._T_FACTORY_RESULT:
+        """Return first free slot of duration starting not before timestamp
+
+        :param duration: slot duration
+        :param after: earliest slot start
+        :param factory: resulting type factory to convert edges to the slot
+        """
+
+        i = bisect.bisect_right(self._starts, after)
+        candidate = after
+        if i and after < self._ends[i - 1]:
+            candidate = self._ends[i - 1]
+        for j in range(i, len(self._starts)):
+            if self._starts[j] - candidate >= duration:
+                break
+            candidate = self._ends[j]
+        return factory(candidate, candidate + duration)
+
@@ -0,0 +1,57 @@
+import datetime
+import itertools
+import unittest
+
+from gperiod import allen
+from gperiod import g
+
+
+def _p(i, j):
+    base = datetime.datetime(2019, 2, 1, 10, 0, 0)
+    hour = datetime.timedelta(hours=1)
+    return g.Period(base + hour * i, base + hour * j)
+
+
+class RelationTestCase(unittest.TestCase):
+
+    def test_relation(self):
+        q = _p(3, 6)
+        subtests = {
+            allen.Relation.BEFORE: _p(0, 2),
+            allen.Relation.MEETS: _p(0, 3),
+            allen.Relation.OVERLAPS: _p(1, 4),
+            allen.Relation.STARTS: _p(3, 4),
+            allen.Relation.DURING: _p(4, 5),
+            allen.Relation.FINISHES: _p(4, 6),
+            allen.Relation.EQUALS: _p(3, 6),
+            allen.Relation.FINISHED_BY: _p(1, 6),
+            allen.Relation.CONTAINS: _p(1, 8),
+            allen.Relation.STARTED_BY: _p(3, 8),
+            allen.Relation.OVERLAPPED_BY: _p(5, 8),
+            allen.Relation.MET_BY: _p(6, 8),
+            allen.Relation.AFTER: _p(7, 8),
+        }
+
+        self.assertEqual(len(subtests), len(allen.Relation))
+        for expected, p in subtests.items():
+            with self.subTest(relation=expected.name):
+                self.assertIs(allen.relation(p, q), expected)
+                self.assertIs(allen.relation(q, p), expected.inverse)
+
+    def test_batch(self):
+        periods = [_p(i, j) for i, j in itertools.combinations(range(5), 2)]
+        pairs = list(itertools.product(periods, repeat=2))
+        left = [p for p, _ in pairs]
+        right = [q for _, q in pairs]
+        expected = [allen.relation(p, q) for p, q in pairs]
+
+        self.assertEqual(allen.relations(left, iter(right)), expected)
+        for rel in allen.Relation:
+            with self.subTest(relation=rel.name):
+                self.assertEqual(allen.relation_mask(left, right, rel),
+                                 [r is rel for r in expected])
+
+    def test_batch_length_mismatch(self):
+        self.assertRaises(ValueError, allen.relations, [_p(0, 1)], [])
+        self.assertRaises(ValueError, allen.relation_mask, [], [_p(0, 1)],
+                          allen.Relation.EQUALS)
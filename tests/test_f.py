@@ -0,0 +1,259 @@
+import datetime
+import types
+import unittest
+
+from gperiod import f
+from gperiod import g
+
+
+FAKE_TS_01 = datetime.datetime(2019, 2, 1, 10, 0, 0)
+FAKE_TS_02 = datetime.datetime(2019, 4, 14, 10, 0)
+FAKE_TS_03 = datetime.datetime(2019, 5, 20, 10, 0)
+FAKE_TS_04 = datetime.datetime(2019, 6, 25, 10, 0)
+FAKE_TS_05 = datetime.datetime(2019, 7, 31, 10, 0)
+FAKE_TS_06 = datetime.datetime(2019, 9, 5, 10, 0)
+FAKE_TS_07 = datetime.datetime(2019, 10, 11, 10, 0)
+FAKE_TS_08 = datetime.datetime(2019, 11, 16, 10, 0)
+FAKE_TS_09 = datetime.datetime(2019, 12, 22, 10, 0)
+FAKE_TS_10 = datetime.datetime(2020, 1, 27, 10, 0)
+
+
+class TestCase(unittest.TestCase):
+
+    def _assert_generator(self, result, expected):
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertEqual(list(result), expected)
+
+
+class LocateTestCase(TestCase):
+
+    def setUp(self):
+        self.periods = [
+            g.Period(FAKE_TS_02, FAKE_TS_03),
+            g.Period(FAKE_TS_03, FAKE_TS_04),
+            g.Period(FAKE_TS_06, FAKE_TS_08),
+        ]
+
+    def test_empty(self):
+        self._assert_generator(f.locate([FAKE_TS_01], []), [None])
+        self._assert_generator(f.locate([], self.periods), [])
+
+    def test_indices(self):
+        stamps = [FAKE_TS_07, FAKE_TS_01, FAKE_TS_03, FAKE_TS_05,
+                  FAKE_TS_02, FAKE_TS_08, FAKE_TS_09]
+        expected = [2, None, 1, None, 0, 2, None]
+
+        self._assert_generator(f.locate(stamps, self.periods), expected)
+
+    def test_periods(self):
+        stamps = [FAKE_TS_01, FAKE_TS_02, FAKE_TS_07]
+        expected = [None, self.periods[0], self.periods[2]]
+
+        self._assert_generator(
+            f.locate(stamps, self.periods, as_period=True),
+            expected,
+        )
+
+    def test_presorted(self):
+        stamps = [FAKE_TS_01, FAKE_TS_02, FAKE_TS_03, FAKE_TS_04,
+                  FAKE_TS_05, FAKE_TS_07, FAKE_TS_08, FAKE_TS_09]
+
+        self._assert_generator(
+            f.locate(stamps, self.periods, presorted=True),
+            list(f.locate(stamps, self.periods)),
+        )
+
+
+class BulkMathTestCase(TestCase):
+
+    def setUp(self):
+        self.periods = [
+            g.Period(FAKE_TS_01, FAKE_TS_02),
+            g.Period(FAKE_TS_03, FAKE_TS_05),
+            g.Period(FAKE_TS_02, FAKE_TS_09),
+        ]
+        self.delta = datetime.timedelta(hours=3)
+
+    def test_shift(self):
+        subtests = {
+            "lshift": (f.lshift_many, g.lshift),
+            "rshift": (f.rshift_many, g.rshift),
+        }
+
+        for subtest, (bulk, single) in subtests.items():
+            with self.subTest(subtest=subtest):
+                self._assert_generator(
+                    bulk(self.periods, self.delta),
+                    [single(p, self.delta) for p in self.periods],
+                )
+                self._assert_generator(
+                    bulk(self.periods, self.delta, factory=g.Tuple),
+                    [single(p, self.delta, factory=g.Tuple)
+                     for p in self.periods],
+                )
+                self.assertRaises(NotImplementedError, bulk, self.periods, 1)
+
+    def test_mul(self):
+        for factor in (2, -3, 0.5, 0):
+            with self.subTest(factor=factor):
+                self.assertEqual(list(f.mul_many(self.periods, factor)),
+                                 [g.mul(p, factor) for p in self.periods])
+
+    def test_div(self):
+        subtests = [
+            (f.floordiv_many, g.floordiv, self.delta),
+            (f.floordiv_many, g.floordiv, 7),
+            (f.mod_many, g.mod, self.delta),
+            (f.truediv_many, g.truediv, self.delta),
+            (f.truediv_many, g.truediv, 2.5),
+        ]
+
+        for bulk, single, other in subtests:
+            with self.subTest(func=single.__name__, other=other):
+                self.assertEqual(list(bulk(self.periods, other)),
+                                 [single(p, other) for p in self.periods])
+                self.assertRaises(NotImplementedError,
+                                  bulk, self.periods, "x")
+
+
+class UniqueTestCase(TestCase):
+
+    def setUp(self):
+        self.p1 = g.Period(FAKE_TS_01, FAKE_TS_02)
+        self.p2 = g.Period(FAKE_TS_01, FAKE_TS_02)
+        self.p3 = g.Period(FAKE_TS_02, FAKE_TS_03)
+        self.sns = types.SimpleNamespace(start=FAKE_TS_02, end=FAKE_TS_03)
+
+    def test_unique(self):
+        result = list(f.unique([self.p1, self.p3, self.p2, self.sns]))
+
+        self.assertEqual(len(result), 2)
+        self.assertIs(result[0], self.p1)
+        self.assertIs(result[1], self.p3)
+
+    def test_group_identical(self):
+        result = f.group_identical([self.p1, self.p3, self.p2, self.sns])
+
+        self.assertEqual(list(result), [(FAKE_TS_01, FAKE_TS_02),
+                                        (FAKE_TS_02, FAKE_TS_03)])
+        self.assertEqual(result[(FAKE_TS_01, FAKE_TS_02)], [self.p1, self.p2])
+        self.assertEqual(len(result[(FAKE_TS_02, FAKE_TS_03)]), 2)
+        self.assertEqual(f.group_identical([]), {})
+
+
+class ChangesTestCase(TestCase):
+
+    def test_empty(self):
+        p = g.Period(FAKE_TS_01, FAKE_TS_02)
+
+        self._assert_generator(f.changes([], []), [])
+        self._assert_generator(f.changes([p], []), [(f.REMOVED, p)])
+        self._assert_generator(f.changes([], [p]), [(f.ADDED, p)])
+        self._assert_generator(f.changes([p], [p]), [(f.UNCHANGED, p)])
+
+    def test_changes(self):
+        old = [
+            g.Period(FAKE_TS_01, FAKE_TS_03),
+            g.Period(FAKE_TS_02, FAKE_TS_04),
+            g.Period(FAKE_TS_04, FAKE_TS_05),
+            g.Period(FAKE_TS_07, FAKE_TS_08),
+        ]
+        new = [
+            g.Period(FAKE_TS_02, FAKE_TS_03),
+            g.Period(FAKE_TS_05, FAKE_TS_06),
+            g.Period(FAKE_TS_07, FAKE_TS_08),
+            g.Period(FAKE_TS_09, FAKE_TS_10),
+        ]
+        expected = [
+            (f.REMOVED, g.Period(FAKE_TS_01, FAKE_TS_02)),
+            (f.UNCHANGED, g.Period(FAKE_TS_02, FAKE_TS_03)),
+            (f.REMOVED, g.Period(FAKE_TS_03, FAKE_TS_05)),
+            (f.ADDED, g.Period(FAKE_TS_05, FAKE_TS_06)),
+            (f.UNCHANGED, g.Period(FAKE_TS_07, FAKE_TS_08)),
+            (f.ADDED, g.Period(FAKE_TS_09, FAKE_TS_10)),
+        ]
+
+        self._assert_generator(f.changes(old, new), expected)
+        self._assert_generator(
+            f.changes(iter(old), iter(new), factory=g.Tuple),
+            [(tag, p.as_args()) for tag, p in expected],
+        )
+
+    def test_unsorted(self):
+        periods = [g.Period(FAKE_TS_03, FAKE_TS_04),
+                   g.Period(FAKE_TS_01, FAKE_TS_02)]
+
+        self.assertRaises(ValueError, list, f.changes(periods, []))
+
+
+class DifferenceManyTestCase(TestCase):
+
+    def test_empty(self):
+        p = g.Period(FAKE_TS_01, FAKE_TS_02)
+
+        self._assert_generator(f.difference_many([], [p]), [])
+        self._assert_generator(f.difference_many([p], []), [p])
+
+    def test_difference(self):
+        bases = [
+            g.Period(FAKE_TS_05, FAKE_TS_10),
+            g.Period(FAKE_TS_01, FAKE_TS_04),
+            g.Period(FAKE_TS_02, FAKE_TS_03),
+            g.Period(FAKE_TS_08, FAKE_TS_09),
+        ]
+        exclusions = [
+            g.Period(FAKE_TS_06, FAKE_TS_07),
+            g.Period(FAKE_TS_03, FAKE_TS_05),
+            g.Period(FAKE_TS_02, FAKE_TS_03),
+            g.Period(FAKE_TS_08, FAKE_TS_10),
+        ]
+        expected = []
+        for base in g.ascend_start(*bases):
+            expected.extend(g.difference(base, *exclusions))
+
+        self._assert_generator(f.difference_many(bases, exclusions), expected)
+        self._assert_generator(
+            f.difference_many(bases, exclusions, factory=g.Tuple),
+            [p.as_args() for p in expected],
+        )
+
+    def test_unsorted(self):
+        bases = [g.Period(FAKE_TS_03, FAKE_TS_04),
+                 g.Period(FAKE_TS_01, FAKE_TS_02)]
+
+        self.assertRaises(ValueError, list, f.difference_sorted(bases, []))
+
+
+class OverlapsTestCase(TestCase):
+
+    def setUp(self):
+        self.periods = [
+            g.Period(FAKE_TS_05, FAKE_TS_07),
+            g.Period(FAKE_TS_01, FAKE_TS_03),
+            g.Period(FAKE_TS_03, FAKE_TS_04),
+            g.Period(FAKE_TS_02, FAKE_TS_06),
+            g.Period(FAKE_TS_08, FAKE_TS_09),
+        ]
+
+    def test_find_overlaps(self):
+        expected = {
+            frozenset((p, q))
+            for i, p in enumerate(self.periods)
+            for q in self.periods[i + 1:]
+            if g.intersection(p, q, factory=g.Tuple)
+        }
+
+        result = list(f.find_overlaps(self.periods))
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual({frozenset(pair) for pair in result}, expected)
+        for p, q in result:
+            self.assertLessEqual(p.start, q.start)
+
+    def test_has_overlaps(self):
+        disjoint = [self.periods[1], self.periods[2], self.periods[4]]
+
+        self.assertTrue(f.has_overlaps(self.periods))
+        self.assertFalse(f.has_overlaps(disjoint))
+        self.assertFalse(f.has_overlaps([]))
+        self._assert_generator(f.find_overlaps(disjoint), [])
@@ -133,6 +133,8 @@ class PeriodBaseTestCase(TestCase):
 
         self.assertEqual(r1, r2)
         self.assertEqual(r1, expected)
+        self.assertEqual(getattr(p1, g._F__HASH), expected)
+        self.assertEqual(hash(p1), expected)
 
     def test_eq(self):
         sns = types.SimpleNamespace(start=FAKE_TS_05, end=FAKE_TS_10)
@@ -339,6 +341,25 @@ class PeriodRepresentationTestCase(TestCase):
             with self.subTest(subtest=subtest):
                 self.assertRaises(ValueError, g.Period.fromisoformat, s)
 
+    def test_from_isoformat_cached(self):
+        s = "2019-07-31T10:00:00/2020-01-27T10:00:00"
+        expected = g.Period(FAKE_TS_05, FAKE_TS_10)
+        self.assertIsNone(g.parse_cache_info())
+        g.enable_parse_cache(maxsize=2)
+        self.addCleanup(g.disable_parse_cache)
+
+        r1 = g.Period.fromisoformat(s)
+        r2 = g.fromisoformat(s)
+        r3 = g.fromisoformat(s, factory=g.Tuple)
+        info = g.parse_cache_info()
+
+        self._assert_result_period(r1, expected)
+        self.assertIs(r1, r2)
+        self._assert_result_datetime_pair(r3, (FAKE_TS_05, FAKE_TS_10))
+        self.assertEqual(info, (1, 2, 2, 2))
+        self.assertAlmostEqual(info.hit_rate, 1 / 3)
+        self.assertRaises(ValueError, g.fromisoformat, s.replace("/", ""))
+
     def test_strptime_simple(self):
         s = "2019-07-31T10:00:00/2020-01-27T10:00:00"
         expected = g.Period(FAKE_TS_05, FAKE_TS_10)
@@ -0,0 +1,76 @@
+import datetime
+import unittest
+
+from gperiod import g
+from gperiod import index
+
+
+FAKE_TS_01 = datetime.datetime(2019, 2, 1, 10, 0, 0)
+FAKE_TS_02 = datetime.datetime(2019, 4, 14, 10, 0)
+FAKE_TS_03 = datetime.datetime(2019, 5, 20, 10, 0)
+FAKE_TS_04 = datetime.datetime(2019, 6, 25, 10, 0)
+FAKE_TS_05 = datetime.datetime(2019, 7, 31, 10, 0)
+FAKE_TS_06 = datetime.datetime(2019, 9, 5, 10, 0)
+FAKE_TS_07 = datetime.datetime(2019, 10, 11, 10, 0)
+FAKE_TS_08 = datetime.datetime(2019, 11, 16, 10, 0)
+
+
+class CountIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.periods = [
+            g.Period(FAKE_TS_01, FAKE_TS_03),
+            g.Period(FAKE_TS_02, FAKE_TS_05),
+            g.Period(FAKE_TS_03, FAKE_TS_04),
+            g.Period(FAKE_TS_06, FAKE_TS_08),
+        ]
+        self.idx = index.CountIndex(*self.periods)
+
+    def _expected_overlaps(self, period):
+        return sum(1 for p in self.periods
+                   if g.intersection(p, period, factory=g.Tuple))
+
+    def _expected_contains(self, ts):
+        return sum(1 for p in self.periods if g.contains(p, ts))
+
+    def test_len(self):
+        self.assertEqual(len(self.idx), 4)
+        self.assertEqual(len(index.CountIndex()), 0)
+
+    def test_count_overlaps(self):
+        windows = [
+            g.Period(FAKE_TS_01, FAKE_TS_08),
+            g.Period(FAKE_TS_03, FAKE_TS_04),
+            g.Period(FAKE_TS_05, FAKE_TS_06),
+            g.Period(FAKE_TS_04, FAKE_TS_07),
+            g.Period(FAKE_TS_07, FAKE_TS_08),
+        ]
+
+        for window in windows:
+            with self.subTest(window=window):
+                self.assertEqual(self.idx.count_overlaps(window),
+                                 self._expected_overlaps(window))
+        self.assertEqual(self.idx.count_overlaps_many(windows),
+                         [self._expected_overlaps(w) for w in windows])
+
+    def test_count_contains(self):
+        stamps = [FAKE_TS_01, FAKE_TS_03, FAKE_TS_05,
+                  FAKE_TS_07, FAKE_TS_08,
+                  datetime.datetime(2000, 1, 1)]
+
+        for ts in stamps:
+            with self.subTest(ts=ts):
+                self.assertEqual(self.idx.count_contains(ts),
+                                 self._expected_contains(ts))
+        self.assertEqual(self.idx.count_contains_many(stamps),
+                         [self._expected_contains(ts) for ts in stamps])
+
+    def test_from_edges(self):
+        idx = index.CountIndex.from_edges(
+            [p.start for p in self.periods],
+            [p.end for p in self.periods],
+        )
+
+        self.assertEqual(idx.count_contains(FAKE_TS_03), 3)
+        self.assertRaises(ValueError, index.CountIndex.from_edges,
+                          [FAKE_TS_01], [])
@@ -0,0 +1,86 @@
+import datetime
+import unittest
+
+from gperiod import g
+from gperiod import ranges
+
+
+FAKE_TS_01 = datetime.datetime(2019, 2, 1, 10, 0, 0)
+STEP = datetime.timedelta(minutes=5)
+
+
+def _p(i, j=None):
+    j = i + 1 if j is None else j
+    return g.Period(FAKE_TS_01 + STEP * i, FAKE_TS_01 + STEP * j)
+
+
+class PeriodRangeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.r = ranges.PeriodRange(FAKE_TS_01, STEP, count=10)
+        self.expected = [_p(i) for i in range(10)]
+
+    def test_init(self):
+        by_end = ranges.PeriodRange(FAKE_TS_01, STEP,
+                                    end=FAKE_TS_01 + STEP * 10.5)
+
+        self.assertEqual(by_end, self.r)
+        self.assertEqual(len(ranges.PeriodRange(FAKE_TS_01, STEP, count=0)), 0)
+        self.assertRaises(TypeError, ranges.PeriodRange, FAKE_TS_01, STEP)
+        self.assertRaises(TypeError, ranges.PeriodRange, FAKE_TS_01, STEP,
+                          count=1, end=FAKE_TS_01)
+        self.assertRaises(ValueError, ranges.PeriodRange, FAKE_TS_01, -STEP,
+                          count=1)
+        self.assertRaises(ValueError, ranges.PeriodRange, FAKE_TS_01, STEP,
+                          count=-1)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.r), 10)
+        self.assertEqual(list(self.r), self.expected)
+        self.assertEqual(list(reversed(self.r)), self.expected[::-1])
+        self.assertEqual(self.r[3], self.expected[3])
+        self.assertEqual(self.r[-1], self.expected[-1])
+        self.assertRaises(IndexError, self.r.__getitem__, 10)
+
+    def test_slice(self):
+        for item in (slice(2, 5), slice(None, None, 3), slice(None, None, -1),
+                     slice(8, 1, -2), slice(20, 30)):
+            with self.subTest(item=item):
+                result = self.r[item]
+                self.assertIsInstance(result, ranges.PeriodRange)
+                self.assertEqual(list(result), self.expected[item])
+
+    def test_contains_index(self):
+        sliced = self.r[1::2]
+
+        self.assertIn(_p(3), self.r)
+        self.assertNotIn(_p(3, 5), self.r)
+        self.assertNotIn(_p(10), self.r)
+        self.assertNotIn(FAKE_TS_01, self.r)
+        self.assertEqual(self.r.index(_p(3)), 3)
+        self.assertEqual(sliced.index(_p(3)), 1)
+        self.assertEqual(sliced.count(_p(4)), 0)
+        self.assertRaises(ValueError, sliced.index, _p(4))
+
+    def test_intersection(self):
+        half = STEP / 2
+        windows = [
+            g.Period(FAKE_TS_01 + STEP * 2, FAKE_TS_01 + STEP * 4),
+            g.Period(FAKE_TS_01 + half, FAKE_TS_01 + STEP * 3 + half),
+            g.Period(FAKE_TS_01 - STEP * 5, FAKE_TS_01),
+            g.Period(FAKE_TS_01 - STEP, FAKE_TS_01 + STEP * 50),
+        ]
+
+        for source in (self.r, self.r[::-1], self.r[1::3]):
+            for window in windows:
+                with self.subTest(source=source, window=window):
+                    expected = [
+                        p for p in source
+                        if g.intersection(p, window, factory=g.Tuple)
+                    ]
+                    self.assertEqual(list(source & window), expected)
+
+    def test_span(self):
+        self.assertEqual(self.r.span, _p(0, 10))
+        self.assertEqual(self.r[::-3].span, _p(0, 10))
+        self.assertIsNone(self.r[5:5].span)
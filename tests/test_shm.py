@@ -0,0 +1,86 @@
+import datetime
+import multiprocessing
+import unittest
+
+from gperiod import g
+from gperiod import shm
+
+
+FAKE_TS_01 = datetime.datetime(2019, 2, 1, 10, 0, 0)
+HOUR = datetime.timedelta(hours=1)
+
+
+def _p(i, j, tz=None):
+    base = FAKE_TS_01.replace(tzinfo=tz)
+    return g.Period(base + HOUR * i, base + HOUR * j)
+
+
+def _worker_count(name, ts):
+    shared = shm.SharedPeriods.attach(name)
+    try:
+        return shared.count_contains(ts), list(shared.containing(ts))
+    finally:
+        shared.close()
+
+
+class SharedPeriodsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.periods = [_p(5, 9), _p(0, 2), _p(1, 6), _p(3, 4), _p(8, 10)]
+        self.shared = shm.SharedPeriods.publish(self.periods)
+        self.addCleanup(self.shared.__exit__, None, None, None)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.shared), 5)
+        self.assertEqual(list(self.shared), g.ascend_start(*self.periods))
+        self.assertEqual(self.shared[-1], _p(8, 10))
+        self.assertRaises(IndexError, self.shared.__getitem__, 5)
+
+    def test_contains(self):
+        for hour in range(-1, 12):
+            ts = FAKE_TS_01 + HOUR * hour
+            expected = [p for p in g.ascend_start(*self.periods)
+                        if g.contains(p, ts)]
+            with self.subTest(hour=hour):
+                self.assertEqual(self.shared.count_contains(ts), len(expected))
+                self.assertEqual(list(self.shared.containing(ts)), expected)
+
+    def test_overlaps(self):
+        for window in (_p(0, 1), _p(2, 3), _p(4, 8), _p(10, 11), _p(-2, 20)):
+            expected = [p for p in g.ascend_start(*self.periods)
+                        if g.intersection(p, window, factory=g.Tuple)]
+            with self.subTest(window=window):
+                self.assertEqual(self.shared.count_overlaps(window),
+                                 len(expected))
+                self.assertEqual(list(self.shared.overlapping(window)),
+                                 expected)
+
+    def test_aware(self):
+        utc = datetime.timezone.utc
+        tz = datetime.timezone(datetime.timedelta(hours=3))
+        periods = [_p(0, 2, tz=tz), _p(1, 3, tz=utc)]
+
+        with shm.SharedPeriods.publish(periods) as shared:
+            self.assertEqual(list(shared), g.ascend_start(*periods))
+            self.assertEqual(shared[0].start.tzinfo, utc)
+            self.assertEqual(shared.count_contains(periods[1].start), 2)
+            self.assertRaises(ValueError, shared.count_contains, FAKE_TS_01)
+        self.assertRaises(ValueError, shm.SharedPeriods.publish,
+                          [_p(0, 1), _p(0, 1, tz=utc)])
+
+    def test_attach(self):
+        attached = shm.SharedPeriods.attach(self.shared.name)
+        self.addCleanup(attached.close)
+
+        self.assertEqual(list(attached), list(self.shared))
+        self.assertRaises(RuntimeError, attached.unlink)
+
+    def test_worker(self):
+        ts = FAKE_TS_01 + HOUR * 5
+        ctx = multiprocessing.get_context("spawn")
+
+        with ctx.Pool(1) as pool:
+            count, found = pool.apply(_worker_count, (self.shared.name, ts))
+
+        self.assertEqual(count, 2)
+        self.assertEqual(found, [_p(1, 6), _p(5, 9)])
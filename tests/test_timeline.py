@@ -0,0 +1,84 @@
+import datetime
+import random
+import unittest
+
+from gperiod import g
+from gperiod import timeline
+
+
+FAKE_TS_01 = datetime.datetime(2019, 2, 1, 10, 0, 0)
+HOUR = datetime.timedelta(hours=1)
+
+
+def _p(i, j):
+    return g.Period(FAKE_TS_01 + HOUR * i, FAKE_TS_01 + HOUR * j)
+
+
+def _merged(periods):
+    result = []
+    for p in sorted(periods, key=lambda p: p.start):
+        if result and p.start <= result[-1].end:
+            result[-1] = g.Period(result[-1].start, max(result[-1].end, p.end))
+        else:
+            result.append(p)
+    return result
+
+
+class TimelineTestCase(unittest.TestCase):
+
+    def test_insert(self):
+        tl = timeline.Timeline(_p(0, 2), _p(5, 6), _p(8, 9))
+        tl.insert(_p(1, 5))
+
+        self.assertEqual(len(tl), 4)
+        self.assertIn(_p(1, 5), tl)
+        self.assertEqual(list(tl.merged()), [_p(0, 6), _p(8, 9)])
+
+    def test_remove(self):
+        tl = timeline.Timeline(_p(0, 2), _p(1, 5), _p(5, 6), _p(1, 5))
+
+        tl.remove(_p(1, 5))
+        self.assertEqual(list(tl.merged()), [_p(0, 6)])
+        tl.remove(_p(1, 5))
+        self.assertEqual(list(tl.merged()), [_p(0, 2), _p(5, 6)])
+        self.assertRaises(KeyError, tl.remove, _p(1, 5))
+        tl.discard(_p(1, 5))
+        self.assertEqual(list(tl), [_p(0, 2), _p(5, 6)])
+
+    def test_random(self):
+        rnd = random.Random(42)
+        tl = timeline.Timeline()
+        live = []
+        for _ in range(500):
+            if live and rnd.random() < 0.4:
+                period = live.pop(rnd.randrange(len(live)))
+                tl.remove(period)
+            else:
+                start = rnd.randrange(100)
+                period = _p(start, start + rnd.randrange(1, 10))
+                live.append(period)
+                tl.insert(period)
+            self.assertEqual(list(tl.merged()), _merged(live))
+
+    def test_is_busy(self):
+        tl = timeline.Timeline(_p(0, 2), _p(5, 6))
+
+        self.assertTrue(tl.is_busy(FAKE_TS_01))
+        self.assertTrue(tl.is_busy(FAKE_TS_01 + HOUR * 2))
+        self.assertFalse(tl.is_busy(FAKE_TS_01 + HOUR * 3))
+        self.assertFalse(tl.is_busy(FAKE_TS_01 - HOUR))
+
+    def test_first_free(self):
+        tl = timeline.Timeline(_p(0, 2), _p(3, 4), _p(6, 7))
+        subtests = [
+            (1, -2, _p(-2, -1)),
+            (1, 0, _p(2, 3)),
+            (2, 0, _p(4, 6)),
+            (2, 5, _p(7, 9)),
+            (1, 4, _p(4, 5)),
+        ]
+
+        for hours, after, expected in subtests:
+            with self.subTest(hours=hours, after=after):
+                result = tl.first_free(HOUR * hours, FAKE_TS_01 + HOUR * after)
+                self.assertEqual(result, expected)